@@ -1,12 +1,17 @@
-from flask import Flask, render_template, request
+from flask import Flask, render_template, request, send_from_directory, url_for
 import pandas as pd
 import joblib
 import datetime
+import json
+import mimetypes
 import os
 import random
 import requests
 
-app = Flask(__name__)
+# Static files are served by the explicit /static route in section 4
+# (precompressed + cache headers for build_static.py output)
+app = Flask(__name__, static_folder=None)
+STATIC_FOLDER = os.path.join(app.root_path, 'static')
 
 # --- 1. CONFIGURATION: LOAD MODELS ---
 print("⚡ Starting system...")
@@ -21,6 +26,9 @@ except Exception as e:
     print(f"❌ Error: Model files not found ({e}). Please run the training script first!")
     exit()
 
+# Open-Meteo endpoint (overridable, e.g. to point at the benchmark stub)
+OPEN_METEO_URL = os.environ.get('OPEN_METEO_URL', 'https://api.open-meteo.com/v1/forecast')
+
 # City Coordinates
 city_coords = {
     'Hanoi': {'lat': 21.0285, 'lon': 105.8542},
@@ -39,7 +47,7 @@ def get_live_weather(city_name):
         return None, "Coordinates not found for this city."
 
     try:
-        url = f"https://api.open-meteo.com/v1/forecast?latitude={coords['lat']}&longitude={coords['lon']}&current=temperature_2m,relative_humidity_2m,rain,surface_pressure,wind_speed_10m&daily=temperature_2m_max,temperature_2m_min&timezone=auto"
+        url = f"{OPEN_METEO_URL}?latitude={coords['lat']}&longitude={coords['lon']}&current=temperature_2m,relative_humidity_2m,rain,surface_pressure,wind_speed_10m&daily=temperature_2m_max,temperature_2m_min&timezone=auto"
         
         response = requests.get(url)
         data = response.json()
@@ -59,9 +67,7 @@ def get_live_weather(city_name):
         return None, f"API Connection Error: {str(e)}"
 
 # --- 3. FORECAST ENGINE ---
-def calculate_forecast(start_data, city, start_date):
-    results = []
-    
+def build_model_input(start_data, city, start_date):
     # 1. Prepare Input for Model
     current_input = {
         'temperature_2m_max': float(start_data['max']),
@@ -83,6 +89,11 @@ def calculate_forecast(start_data, city, start_date):
     input_df = input_df.reindex(columns=model_columns, fill_value=0)
     if 'temperature_2m_mean' in input_df.columns:
         input_df = input_df.drop(columns=['temperature_2m_mean'])
+    return input_df
+
+def calculate_forecast(start_data, city, start_date):
+    results = []
+    input_df = build_model_input(start_data, city, start_date)
     
     current_date_obj = pd.to_datetime(start_date)
 
@@ -115,7 +126,59 @@ def calculate_forecast(start_data, city, start_date):
         
     return results, None
 
-# --- 4. HELPER FUNCTION ---
+# --- 4. STATIC ASSETS (built by build_static.py) ---
+# If static/dist/manifest.json exists, url_for('static', filename='hanoi.jpg')
+# resolves to the resized, content-hashed copy, and those files are served
+# precompressed (when smaller) with a 1-year immutable cache header.
+STATIC_DIST = 'dist'
+asset_manifest = {}
+try:
+    with open(os.path.join(STATIC_FOLDER, STATIC_DIST, 'manifest.json')) as f:
+        asset_manifest = json.load(f)
+    print(f"✅ Static manifest loaded ({len(asset_manifest)} assets).")
+except FileNotFoundError:
+    print("⚠️ No static manifest, serving original images. Run build_static.py to build it.")
+
+@app.url_defaults
+def fingerprint_static(endpoint, values):
+    if endpoint == 'static' and values.get('filename') in asset_manifest:
+        values['filename'] = f"{STATIC_DIST}/{asset_manifest[values['filename']]['src']}"
+
+@app.context_processor
+def inject_picture_sources():
+    # [(mime type, srcset)] for <picture><source> tags, best format first
+    def picture_sources(filename):
+        srcset = asset_manifest.get(filename, {}).get('srcset', {})
+        return [
+            (f"image/{fmt}", ", ".join(f"{url_for('static', filename=f'{STATIC_DIST}/{name}')} {width}w"
+                                       for name, width in srcset[fmt]))
+            for fmt in ['avif', 'webp'] if fmt in srcset
+        ]
+    return dict(picture_sources=picture_sources)
+
+@app.route('/static/<path:filename>', endpoint='static')
+def serve_static(filename):
+    if not filename.startswith(STATIC_DIST + '/') or filename.endswith('/manifest.json'):
+        return send_from_directory(STATIC_FOLDER, filename)
+
+    response = None
+    for encoding, suffix in [('br', '.br'), ('gzip', '.gz')]:
+        # quality() is 0 for "gzip;q=0", i.e. the client refuses it
+        if request.accept_encodings.quality(encoding) > 0 and \
+                os.path.isfile(os.path.join(STATIC_FOLDER, filename + suffix)):
+            response = send_from_directory(STATIC_FOLDER, filename + suffix,
+                                           mimetype=mimetypes.guess_type(filename)[0])
+            response.headers['Content-Encoding'] = encoding
+            break
+    if response is None:
+        response = send_from_directory(STATIC_FOLDER, filename)
+
+    # File names change with their content, so they never need revalidation
+    response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+    response.headers['Vary'] = 'Accept-Encoding'
+    return response
+
+# --- 5. HELPER FUNCTION ---
 def run_dashboard_logic(city):
     # 1. Get Live Data
     today_str = datetime.date.today().strftime('%Y-%m-%d')
@@ -136,7 +199,7 @@ def run_dashboard_logic(city):
     forecast, err = calculate_forecast(start_data, city, today_str)
     return live_data, forecast, err
 
-# --- 5. WEB ROUTES ---
+# --- 6. WEB ROUTES ---
 @app.route('/', methods=['GET', 'POST'])
 def index():
     city = 'Ho Chi Minh City'
@@ -0,0 +1,287 @@
+import os
+import sys
+import json
+import time
+import random
+import logging
+import argparse
+import datetime
+import platform
+import subprocess
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import requests
+from openmeteo_stub import start_stub
+
+# Benchmark suite for the forecast request path in app.py.
+#
+#   micro: build_model_input, one predict() step, calculate_forecast,
+#          get_live_weather (stub, no latency) and rendering index2.html
+#   macro: N app workers (separate processes) under concurrent POST /
+#          load, with Open-Meteo replaced by a local stub
+#
+# Results go to benchmarks/results/<commit>.json; pass --compare OLD.json
+# to see the change against an earlier run.
+#
+#   python benchmarks/bench_forecast.py --workers 2 --concurrency 16 --stub-latency-ms 50
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(ROOT, 'benchmarks', 'results')
+
+CITIES = ['Hanoi', 'Hue', 'Da Nang', 'Ho Chi Minh City', 'Can Tho', 'Da Lat', 'Vinh']
+
+
+# ---------------------------------------------------------
+# HELPERS
+# ---------------------------------------------------------
+def summarize(seconds):
+    ms = np.asarray(seconds) * 1000
+    return {
+        'n': int(len(ms)),
+        'mean_ms': round(float(ms.mean()), 4),
+        'p50_ms': round(float(np.percentile(ms, 50)), 4),
+        'p95_ms': round(float(np.percentile(ms, 95)), 4),
+        'p99_ms': round(float(np.percentile(ms, 99)), 4),
+    }
+
+
+def bench(fn, repeat, warmup=5):
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return summarize(samples)
+
+
+def memory_mb(pid):
+    # Current and peak resident memory from /proc (Linux only)
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            fields = dict(line.split(':', 1) for line in f)
+    except OSError:
+        return {'rss_mb': None, 'peak_rss_mb': None}
+    kb = lambda key: int(fields[key].split()[0]) if key in fields else None
+    rss, peak = kb('VmRSS'), kb('VmHWM')
+    return {
+        'rss_mb': round(rss / 1024, 1) if rss else None,
+        'peak_rss_mb': round(peak / 1024, 1) if peak else None,
+    }
+
+
+def git_commit():
+    try:
+        commit = subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, text=True).strip()
+        dirty = subprocess.check_output(['git', 'status', '--porcelain', '--untracked-files=no'],
+                                        cwd=ROOT, text=True).strip()
+        return commit + ('-dirty' if dirty else '')
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def load_app(stub_url):
+    # app.py loads models with relative paths and reads OPEN_METEO_URL on import
+    os.environ['OPEN_METEO_URL'] = stub_url
+    os.chdir(ROOT)
+    if ROOT not in sys.path:
+        sys.path.insert(0, ROOT)
+    import app
+    return app
+
+
+# ---------------------------------------------------------
+# 1. MICROBENCHMARKS
+# ---------------------------------------------------------
+def run_micro(app, stub, repeat):
+    print("🔬 Microbenchmarks...")
+    stub.latency_ms = 0
+    today = datetime.date.today().strftime('%Y-%m-%d')
+    start_data = {'mean': 29.5, 'max': 33.1, 'min': 25.4, 'rain': 0.2, 'hum': 74, 'press': 1008.6}
+    city = 'Hanoi'
+    input_df = app.build_model_input(start_data, city, today)
+    forecast, _ = app.calculate_forecast(start_data, city, today)
+
+    def render():
+        with app.app.test_request_context('/'):
+            app.render_template('index2.html', city=city, weather=start_data, forecast=forecast,
+                                error=None, city_image='hanoi.jpg', ad_image='ad1.jpg',
+                                date_display='01/01/2026')
+
+    cases = {
+        'build_model_input': lambda: app.build_model_input(start_data, city, today),
+        'predict_step_max': lambda: app.model_max.predict(input_df),
+        'predict_step_min': lambda: app.model_min.predict(input_df),
+        'calculate_forecast': lambda: app.calculate_forecast(start_data, city, today),
+        'get_live_weather_stub': lambda: app.get_live_weather(city),
+        'render_index': render,
+    }
+    results = {}
+    for name, fn in cases.items():
+        results[name] = bench(fn, repeat)
+        print(f"   -> {name:<22} p50 {results[name]['p50_ms']:8.3f} ms | p99 {results[name]['p99_ms']:8.3f} ms")
+    return results
+
+
+# ---------------------------------------------------------
+# 2. LOAD TEST
+# ---------------------------------------------------------
+def serve_worker(stub_url, ports):
+    app = load_app(stub_url)
+    from werkzeug.serving import make_server
+    logging.getLogger('werkzeug').setLevel(logging.ERROR)  # no per-request access log
+    server = make_server('127.0.0.1', 0, app.app, threaded=True)
+    ports.put((os.getpid(), server.server_port))
+    server.serve_forever()
+
+
+def run_macro(stub, stub_url, args):
+    print(f"🚦 Load test: {args.workers} worker(s), {args.concurrency} concurrent clients, "
+          f"{args.duration}s, stub latency {args.stub_latency_ms} ms...")
+    stub.latency_ms = args.stub_latency_ms
+
+    # spawn: each worker imports the app itself, so its memory is its own
+    ctx = multiprocessing.get_context('spawn')
+    ports = ctx.Queue()
+    workers = [ctx.Process(target=serve_worker, args=(stub_url, ports), daemon=True)
+               for _ in range(args.workers)]
+    for w in workers:
+        w.start()
+    endpoints = [ports.get(timeout=120) for _ in workers]
+    urls = [f"http://127.0.0.1:{port}/" for _, port in endpoints]
+
+    try:
+        def client(i):
+            rng = random.Random(args.seed + i)
+            session = requests.Session()
+            url = urls[i % len(urls)]
+            samples, errors = [], 0
+            # Warm-up request (first render compiles the template)
+            try:
+                session.post(url, data={'city': 'Hanoi'})
+            except requests.RequestException:
+                errors += 1
+            while time.perf_counter() < deadline:
+                start = time.perf_counter()
+                try:
+                    response = session.post(url, data={'city': rng.choice(CITIES)})
+                    ok = response.status_code == 200
+                except requests.RequestException:
+                    ok = False
+                if ok:
+                    samples.append(time.perf_counter() - start)
+                else:
+                    errors += 1
+            return samples, errors
+
+        begin = time.perf_counter()
+        deadline = begin + args.duration
+        with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+            outcomes = list(pool.map(client, range(args.concurrency)))
+        elapsed = time.perf_counter() - begin
+
+        memory = [dict(pid=pid, **memory_mb(pid)) for pid, _ in endpoints]
+    finally:
+        for w in workers:
+            w.terminate()
+            w.join()
+
+    samples = [s for samples, _ in outcomes for s in samples]
+    errors = sum(e for _, e in outcomes)
+    if not samples:
+        raise RuntimeError(f"Load test got no successful responses ({errors} errors).")
+    result = {
+        'requests': len(samples),
+        'errors': errors,
+        'throughput_rps': round(len(samples) / elapsed, 2),
+        'latency': summarize(samples),
+        'workers': memory,
+    }
+    print(f"   -> {result['throughput_rps']} req/s | p50 {result['latency']['p50_ms']:.1f} ms | "
+          f"p95 {result['latency']['p95_ms']:.1f} ms | p99 {result['latency']['p99_ms']:.1f} ms | "
+          f"{errors} errors")
+    for m in memory:
+        print(f"   -> worker {m['pid']}: RSS {m['rss_mb']} MB (peak {m['peak_rss_mb']} MB)")
+    return result
+
+
+# ---------------------------------------------------------
+# 3. COMPARE
+# ---------------------------------------------------------
+def flatten(results):
+    rows = {}
+    for name, stats in results.get('micro', {}).items():
+        rows[f"micro.{name}.p50_ms"] = stats['p50_ms']
+        rows[f"micro.{name}.p99_ms"] = stats['p99_ms']
+    macro = results.get('macro')
+    if macro:
+        rows['macro.throughput_rps'] = macro['throughput_rps']
+        for key in ['p50_ms', 'p95_ms', 'p99_ms']:
+            rows[f"macro.latency.{key}"] = macro['latency'][key]
+        rss = [w['peak_rss_mb'] for w in macro['workers'] if w['peak_rss_mb']]
+        if rss:
+            rows['macro.max_worker_peak_rss_mb'] = max(rss)
+    return rows
+
+
+def compare(old, new):
+    print(f"\n📊 {old['meta']['commit']} -> {new['meta']['commit']}")
+    before, after = flatten(old), flatten(new)
+    for key in after:
+        if key not in before or not before[key]:
+            continue
+        change = (after[key] - before[key]) / before[key] * 100
+        # Throughput: higher is better. Everything else: lower is better.
+        worse = change < 0 if key.endswith('_rps') else change > 0
+        flag = '❌' if worse and abs(change) >= 10 else '  '
+        print(f"{flag} {key:<40} {before[key]:>10.3f} -> {after[key]:>10.3f} ({change:+.1f}%)")
+
+
+# ---------------------------------------------------------
+# 4. MAIN
+# ---------------------------------------------------------
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark the forecast request path")
+    parser.add_argument("--repeat", type=int, default=200, help="Calls per microbenchmark")
+    parser.add_argument("--workers", type=int, default=2, help="App worker processes for the load test")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent load-test clients")
+    parser.add_argument("--duration", type=float, default=15, help="Load test duration (s)")
+    parser.add_argument("--stub-latency-ms", type=float, default=50, help="Simulated Open-Meteo latency")
+    parser.add_argument("--skip-micro", action="store_true")
+    parser.add_argument("--skip-macro", action="store_true")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Result file (default: benchmarks/results/<commit>.json)")
+    parser.add_argument("--compare", help="Earlier result file to compare against")
+    args = parser.parse_args()
+
+    stub, stub_url = start_stub()
+    app = load_app(stub_url)
+
+    commit = git_commit()
+    results = {
+        'meta': {
+            'commit': commit,
+            'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'args': {k: v for k, v in vars(args).items() if k not in ('output', 'compare')},
+        },
+    }
+    if not args.skip_micro:
+        results['micro'] = run_micro(app, stub, args.repeat)
+    if not args.skip_macro:
+        results['macro'] = run_macro(stub, stub_url, args)
+    stub.shutdown()
+
+    output = args.output or os.path.join(RESULTS_DIR, f"{commit}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"✅ Results saved to {output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(json.load(f), results)
@@ -0,0 +1,61 @@
+import json
+import time
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Local stand-in for https://api.open-meteo.com/v1/forecast so load tests
+# measure our code, not the internet. Every request sleeps
+# `server.latency_ms` (can be changed while running) and returns a fixed
+# payload with the fields get_live_weather() reads.
+
+PAYLOAD = json.dumps({
+    'current': {
+        'temperature_2m': 29.5,
+        'relative_humidity_2m': 74,
+        'rain': 0.2,
+        'surface_pressure': 1008.6,
+        'wind_speed_10m': 11.3,
+    },
+    'daily': {
+        'temperature_2m_max': [33.1],
+        'temperature_2m_min': [25.4],
+    },
+}).encode()
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.server.latency_ms:
+            time.sleep(self.server.latency_ms / 1000)
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(PAYLOAD)))
+        self.end_headers()
+        self.wfile.write(PAYLOAD)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_stub(latency_ms=0.0, port=0):
+    """Start the stub in a background thread. Returns (server, base_url)."""
+    server = ThreadingHTTPServer(('127.0.0.1', port), StubHandler)
+    server.daemon_threads = True
+    server.latency_ms = latency_ms
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/v1/forecast"
+
+
+if __name__ == '__main__':
+    import argparse
+    parser = argparse.ArgumentParser(description="Run the Open-Meteo stub on its own")
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    args = parser.parse_args()
+
+    server, url = start_stub(args.latency_ms, args.port)
+    print(f"🌤️  Open-Meteo stub on {url} ({args.latency_ms} ms latency). Ctrl+C to stop.")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
@@ -0,0 +1,156 @@
+import os
+import io
+import gzip
+import json
+import shutil
+import hashlib
+import argparse
+from PIL import Image, ImageOps, features
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Build step for the dashboard images in static/.
+# For every image it writes into static/dist/:
+#   - resized copies (one per width) in the original format, WebP and AVIF,
+#     never larger than the source file
+#   - content-hashed file names (name.<hash>.ext), safe to cache forever
+#   - .gz / .br precompressed copies, only when they are actually smaller
+# and a manifest.json that app.py uses to resolve url_for('static', ...).
+
+parser = argparse.ArgumentParser(description="Build resized, fingerprinted and precompressed static assets")
+parser.add_argument("--src", default="static")
+parser.add_argument("--out", default="static/dist")
+parser.add_argument("--widths", type=int, nargs="+", default=[480, 960], help="Resized widths (px)")
+parser.add_argument("--quality", type=int, default=75)
+args = parser.parse_args()
+
+IMAGE_EXTS = {'.jpg', '.jpeg', '.png'}
+COPY_EXTS = {'.gif', '.svg', '.ico', '.css', '.js'}  # copied as-is (GIFs may be animated)
+MIN_SAVING = 0.9  # keep a precompressed copy only if it is < 90% of the original
+
+modern_formats = [fmt for fmt in ['webp', 'avif'] if features.check(fmt)]
+
+
+def fingerprint(data):
+    return hashlib.sha256(data).hexdigest()[:10]
+
+
+def write_asset(stem, ext, data):
+    name = f"{stem}.{fingerprint(data)}{ext}"
+    path = os.path.join(args.out, name)
+    with open(path, 'wb') as f:
+        f.write(data)
+
+    # Precompressed copies for the static view in app.py
+    gz = gzip.compress(data, compresslevel=9, mtime=0)
+    if len(gz) < len(data) * MIN_SAVING:
+        with open(path + '.gz', 'wb') as f:
+            f.write(gz)
+    if brotli is not None:
+        br = brotli.compress(data, quality=11)
+        if len(br) < len(data) * MIN_SAVING:
+            with open(path + '.br', 'wb') as f:
+                f.write(br)
+    return name
+
+
+def encode(img, fmt, quality, icc_profile=None):
+    # icc_profile: the source's colour profile, so wide-gamut photos keep their colours
+    buffer = io.BytesIO()
+    if fmt == 'jpeg':
+        img.convert('RGB').save(buffer, 'JPEG', quality=quality, optimize=True, progressive=True,
+                                icc_profile=icc_profile)
+    elif fmt == 'png':
+        img.save(buffer, 'PNG', optimize=True, icc_profile=icc_profile)
+    elif fmt == 'webp':
+        img.save(buffer, 'WEBP', quality=quality, method=6, icc_profile=icc_profile)
+    elif fmt == 'avif':
+        img.save(buffer, 'AVIF', quality=quality, icc_profile=icc_profile)
+    return buffer.getvalue()
+
+
+def encode_smaller(img, fmt, limit, icc_profile=None):
+    # Lower the quality step by step until the variant is smaller than the
+    # source file; None if it never is (PNG has no quality setting)
+    for quality in [args.quality, args.quality - 15, args.quality - 30]:
+        data = encode(img, fmt, quality, icc_profile)
+        if len(data) < limit or fmt == 'png':
+            break
+    return data if len(data) < limit else None
+
+
+# ---------------------------------------------------------
+# 1. CLEAN OUTPUT
+# ---------------------------------------------------------
+if os.path.isdir(args.out):
+    shutil.rmtree(args.out)
+os.makedirs(args.out)
+
+# ---------------------------------------------------------
+# 2. BUILD ASSETS
+# ---------------------------------------------------------
+print(f"🖼️  Building assets from {args.src}/ (formats: original, {', '.join(modern_formats)})...")
+manifest = {}
+total_before = total_after = 0
+
+for filename in sorted(os.listdir(args.src)):
+    src_path = os.path.join(args.src, filename)
+    stem, ext = os.path.splitext(filename)
+    ext = ext.lower()
+    if not os.path.isfile(src_path) or ext not in IMAGE_EXTS | COPY_EXTS:
+        continue
+
+    with open(src_path, 'rb') as f:
+        original = f.read()
+
+    if ext in COPY_EXTS:
+        manifest[filename] = {'src': write_asset(stem, ext, original)}
+        continue
+
+    img = Image.open(io.BytesIO(original))
+    img.load()
+    icc_profile = img.info.get('icc_profile')  # convert() below may drop img.info
+    img = ImageOps.exif_transpose(img)  # bake in the camera rotation before resizing
+    base_format = 'png' if ext == '.png' else 'jpeg'
+    if img.mode not in ('RGB', 'RGBA'):
+        img = img.convert('RGBA' if 'transparency' in img.info or img.mode in ('LA', 'PA') else 'RGB')
+
+    entry = {'width': img.width, 'height': img.height, 'srcset': {}}
+    widths = sorted({w for w in args.widths if w < img.width} | {min(img.width, max(args.widths))})
+
+    for width in widths:
+        resized = img if width == img.width else img.resize(
+            (width, round(img.height * width / img.width)), Image.LANCZOS)
+        for fmt in [base_format] + modern_formats:
+            out_ext = '.jpg' if fmt == 'jpeg' else f'.{fmt}'
+            data, variant_width = encode_smaller(resized, fmt, len(original), icc_profile), width
+            if data is None:
+                if fmt != base_format:
+                    continue  # browser falls back to the next <source> / <img>
+                # Never serve more bytes than the source: use it unchanged
+                data, variant_width = original, img.width
+            name = write_asset(f"{stem}-{variant_width}w", out_ext, data)
+            variants = entry['srcset'].setdefault(fmt, [])
+            if [name, variant_width] not in variants:
+                variants.append([name, variant_width])
+
+    # Default <img src>: largest variant in the original format
+    entry['srcset'][base_format].sort(key=lambda v: v[1])
+    entry['src'] = entry['srcset'][base_format][-1][0]
+    manifest[filename] = entry
+
+    after = os.path.getsize(os.path.join(args.out, entry['src']))
+    total_before += len(original)
+    total_after += after
+    print(f"   -> {filename}: {len(original) / 1024:.0f} KB -> {after / 1024:.0f} KB "
+          f"({base_format}, {entry['srcset'][base_format][-1][1]}px)")
+
+with open(os.path.join(args.out, 'manifest.json'), 'w') as f:
+    json.dump(manifest, f, indent=2)
+
+if total_before:
+    print(f"✅ DONE! {len(manifest)} assets, images {total_before / 1024:.0f} KB -> {total_after / 1024:.0f} KB "
+          f"before WebP/AVIF. Manifest: {args.out}/manifest.json")
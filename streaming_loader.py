@@ -0,0 +1,117 @@
+import os
+import pandas as pd
+
+# Streaming data path for datasets too big to load with one pd.read_csv.
+#
+# 1. partition_by_city() reads the CSV in fixed-size chunks and appends
+#    every row to a per-city spill file on disk (the source file does not
+#    need to be sorted by city).
+# 2. iter_city_chunks() yields one city at a time, sorted by date, with
+#    the next-day targets already built.
+#
+# Peak memory is one read chunk + one city's history, never the whole file.
+
+# Standardize City Names (same as the training scripts)
+city_map = {
+    'Huế': 'Hue', 'Cà Mau': 'Ca Mau', 'Đà Nẵng': 'Da Nang',
+    'Đà Lạt': 'Da Lat', 'Hà Nội': 'Hanoi',
+    'TP. Hồ Chí Minh': 'Ho Chi Minh City', 'Hồ Chí Minh': 'Ho Chi Minh City'
+}
+
+# Kaggle layout (resource/vietnam_weather_kaggle.csv) -> Open-Meteo layout
+column_map = {
+    'province': 'city',
+    'date': 'time',
+    'max': 'temperature_2m_max',
+    'min': 'temperature_2m_min',
+    'rain': 'precipitation_sum',
+    'humidi': 'humidity_avg',
+    'pressure': 'pressure_avg',
+}
+
+features = [
+    'temperature_2m_max', 'temperature_2m_min',
+    'precipitation_sum', 'humidity_avg', 'pressure_avg', 'Month'
+]
+
+
+def partition_by_city(path, out_dir, chunksize=50_000):
+    """Spill `path` into one CSV per city inside `out_dir`.
+
+    Returns {city: partition_file}, sorted by city name.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    partitions = {}
+
+    for chunk in pd.read_csv(path, chunksize=chunksize):
+        chunk = chunk.rename(columns=column_map)
+        chunk = chunk[['time', 'city'] + [c for c in features if c != 'Month']]
+        chunk['city'] = chunk['city'].replace(city_map)
+
+        for city, rows in chunk.groupby('city', sort=False):
+            first_write = city not in partitions
+            if first_write:
+                partitions[city] = os.path.join(out_dir, f"city_{len(partitions)}.csv")
+            rows.to_csv(partitions[city], mode='w' if first_write else 'a',
+                        header=first_write, index=False)
+
+    return dict(sorted(partitions.items()))
+
+
+def parse_time(values):
+    # ISO timestamps (Open-Meteo hourly: 2020-01-01T13:00) first, then the
+    # day-first dates of the existing CSVs (13/01/2009). dayfirst=True on
+    # ISO strings would swap their day and month.
+    parsed = pd.to_datetime(values, format='ISO8601', errors='coerce')
+    missing = parsed.isna()
+    if missing.any():
+        parsed[missing] = pd.to_datetime(values[missing], dayfirst=True, format='mixed')
+    return parsed
+
+
+def iter_city_chunks(partitions):
+    """Yield (city, DataFrame) for each partition, one row per calendar day.
+
+    Sub-daily (e.g. hourly) rows are aggregated to daily values first. The
+    next-day target is looked up by date + 1 day, so a gap in the history
+    never pairs a day with the wrong "tomorrow".
+    """
+    for city, part_file in partitions.items():
+        df = pd.read_csv(part_file)
+        df['time'] = parse_time(df['time'])
+        for col in ['temperature_2m_max', 'temperature_2m_min']:
+            df[col] = pd.to_numeric(df[col], errors='coerce')
+        for col in ['precipitation_sum', 'humidity_avg', 'pressure_avg']:
+            df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
+
+        df = df.groupby(df['time'].dt.normalize()).agg(
+            temperature_2m_max=('temperature_2m_max', 'max'),
+            temperature_2m_min=('temperature_2m_min', 'min'),
+            precipitation_sum=('precipitation_sum', 'sum'),
+            humidity_avg=('humidity_avg', 'mean'),
+            pressure_avg=('pressure_avg', 'mean'),
+        )
+        next_day = df.index + pd.Timedelta(days=1)
+        df['Target_NextDay_Max'] = df['temperature_2m_max'].reindex(next_day).values
+        df['Target_NextDay_Min'] = df['temperature_2m_min'].reindex(next_day).values
+        df = df.reset_index()
+        df['Month'] = df['time'].dt.month
+        df = df.dropna(subset=['temperature_2m_max', 'temperature_2m_min',
+                               'Target_NextDay_Max', 'Target_NextDay_Min'])
+
+        if len(df):
+            yield city, df
+
+
+def city_columns(cities):
+    # Same columns pd.get_dummies(..., drop_first=True) gives on the full dataset
+    return [f"city_{c}" for c in sorted(cities)[1:]]
+
+
+def build_features(df, city, model_columns):
+    """Model input for one city chunk, aligned to the full column list."""
+    X = df[features].copy()
+    for col in model_columns:
+        if col.startswith('city_'):
+            X[col] = 1 if col == f"city_{city}" else 0
+    return X.reindex(columns=model_columns, fill_value=0)
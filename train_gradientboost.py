@@ -1,6 +1,8 @@
+import os
+import json
 import pandas as pd
 import joblib
-from sklearn.ensemble import GradientBoostingRegressor
+from sklearn.ensemble import GradientBoostingRegressor, RandomForestRegressor
 
 # 1. TẢI DỮ LIỆU
 print("⏳ Loading data...")
@@ -10,7 +12,7 @@ try:
 except:
     df = pd.read_csv("resource/vietnam_weather_final.csv")
 
-df['time'] = pd.to_datetime(df['time'])
+df['time'] = pd.to_datetime(df['time'], dayfirst=True)
 df['Month'] = df['time'].dt.month
 
 # Standardize City Names
@@ -53,15 +55,32 @@ joblib.dump(X.columns, 'model_columns.joblib')
 # 4. TRAIN MODELS
 print("🚀 Training Models...")
 
+# Use the config chosen by tune_hyperparams.py if it exists
+model_classes = {
+    'Gradient_Boosting': GradientBoostingRegressor,
+    'Random_Forest': RandomForestRegressor,
+}
+best_params = {}
+if os.path.exists('models/best_params.json'):
+    with open('models/best_params.json') as f:
+        best_params = json.load(f)
+    print("   -> Using tuned config from models/best_params.json")
+
+def build_model(target):
+    config = best_params.get(target)
+    if config is None:
+        return GradientBoostingRegressor(n_estimators=100, random_state=42)
+    return model_classes[config['model']](random_state=42, **config['params'])
+
 # Model 1: Predict Next Day MAX
 print("   -> Training Max Temp Model...")
-model_max = GradientBoostingRegressor(n_estimators=100, random_state=42)
+model_max = build_model('max')
 model_max.fit(X, df['Target_NextDay_Max'])  # <--- Uses new column
 joblib.dump(model_max, 'models/model_max.joblib')
 
 # Model 2: Predict Next Day MIN
 print("   -> Training Min Temp Model...")
-model_min = GradientBoostingRegressor(n_estimators=100, random_state=42)
+model_min = build_model('min')
 model_min.fit(X, df['Target_NextDay_Min'])  # <--- Uses new column
 joblib.dump(model_min, 'models/model_min.joblib')
 
@@ -0,0 +1,120 @@
+import argparse
+import tempfile
+import numpy as np
+import pandas as pd
+import joblib
+from sklearn.linear_model import LinearRegression
+from streaming_loader import partition_by_city, iter_city_chunks, city_columns, build_features, features
+
+# Out-of-core version of train_gradientboost.py: the data is streamed one
+# city at a time, so memory stays bounded by the largest city's history.
+#
+# The model is a (ridge) linear regression solved from sufficient
+# statistics: every city chunk adds its XᵀX and Xᵀy, which only take
+# (features+1)² numbers. That is an exact fit in one pass, independent of
+# the order the cities come in.
+
+parser = argparse.ArgumentParser(description="Train Max & Min models without loading the whole dataset")
+parser.add_argument("--data", default="resource/vietnam_weather_full_filled.csv")
+parser.add_argument("--chunksize", type=int, default=50_000, help="Rows per read chunk")
+parser.add_argument("--holdout-days", type=int, default=365, help="Most recent days kept out for evaluation")
+parser.add_argument("--alpha", type=float, default=1.0, help="Ridge penalty (0 = ordinary least squares)")
+args = parser.parse_args()
+
+targets = ['max', 'min']
+
+
+def design_matrix(chunk, city):
+    X = build_features(chunk, city, model_columns).to_numpy(dtype=float)
+    return np.hstack([X, np.ones((len(X), 1))])  # last column = intercept
+
+
+def accumulate(stats, X, chunk):
+    stats['xtx'] += X.T @ X
+    for target in targets:
+        stats['xty'][target] += X.T @ chunk[f'Target_NextDay_{target.capitalize()}'].to_numpy()
+    stats['rows'] += len(X)
+
+
+def solve(stats, target):
+    penalty = args.alpha * np.eye(len(stats['xtx']))
+    penalty[-1, -1] = 0  # do not shrink the intercept
+    weights = np.linalg.solve(stats['xtx'] + penalty, stats['xty'][target])
+
+    # Same interface as the app models: predict() on a DataFrame with model_columns
+    model = LinearRegression()
+    model.coef_, model.intercept_ = weights[:-1], weights[-1]
+    model.n_features_in_ = len(model_columns)
+    model.feature_names_in_ = np.array(model_columns, dtype=object)
+    return model
+
+
+with tempfile.TemporaryDirectory() as spill_dir:
+    # ---------------------------------------------------------
+    # 1. PARTITION DATA BY CITY (streamed)
+    # ---------------------------------------------------------
+    print(f"⏳ Streaming {args.data} in chunks of {args.chunksize} rows...")
+    partitions = partition_by_city(args.data, spill_dir, chunksize=args.chunksize)
+    print(f"   -> {len(partitions)} cities found")
+
+    model_columns = features + city_columns(partitions)
+
+    # ---------------------------------------------------------
+    # 2. FIND HOLD-OUT CUTOFF (last --holdout-days of the data)
+    # ---------------------------------------------------------
+    last_dates = [chunk['time'].max() for _, chunk in iter_city_chunks(partitions)]
+    if not last_dates:
+        raise SystemExit(f"❌ Error: no usable rows in {args.data} "
+                         "(need at least 2 consecutive days per city with max/min temperature).")
+    cutoff = max(last_dates) - pd.Timedelta(days=args.holdout_days)
+    print(f"📅 Training on days <= {cutoff.date()}, evaluating on the {args.holdout_days} days after")
+
+    # ---------------------------------------------------------
+    # 3. ACCUMULATE XᵀX / Xᵀy (one pass, one city at a time)
+    # ---------------------------------------------------------
+    print("🚀 Training Models...")
+    n = len(model_columns) + 1
+    new_stats = lambda: {'xtx': np.zeros((n, n)), 'xty': {t: np.zeros(n) for t in targets}, 'rows': 0}
+    train_stats, all_stats = new_stats(), new_stats()
+
+    for city, chunk in iter_city_chunks(partitions):
+        X = design_matrix(chunk, city)
+        accumulate(all_stats, X, chunk)
+        is_train = (chunk['time'] <= cutoff).to_numpy()
+        if is_train.any():
+            accumulate(train_stats, X[is_train], chunk[is_train])
+
+    if train_stats['rows'] == 0:
+        raise SystemExit("❌ Error: no rows before the hold-out cutoff; lower --holdout-days.")
+
+    # ---------------------------------------------------------
+    # 4. HOLD-OUT MAE (model trained only on days <= cutoff)
+    # ---------------------------------------------------------
+    holdout_models = {t: solve(train_stats, t) for t in targets}
+    errors = {t: 0.0 for t in targets}
+    holdout_rows = 0
+    for city, chunk in iter_city_chunks(partitions):
+        chunk = chunk[chunk['time'] > cutoff]
+        if chunk.empty:
+            continue
+        X = build_features(chunk, city, model_columns)
+        for target, model in holdout_models.items():
+            y = chunk[f'Target_NextDay_{target.capitalize()}'].to_numpy()
+            errors[target] += np.abs(y - model.predict(X)).sum()
+        holdout_rows += len(chunk)
+
+    if holdout_rows:
+        print(f"   -> Hold-out MAE ({holdout_rows} rows): max {errors['max'] / holdout_rows:.4f}°C | "
+              f"min {errors['min'] / holdout_rows:.4f}°C")
+    else:
+        print("   -> No rows after the cutoff, hold-out MAE skipped.")
+
+# ---------------------------------------------------------
+# 5. SAVE (final model fitted on all days)
+# ---------------------------------------------------------
+for target in targets:
+    joblib.dump(solve(all_stats, target), f'models/model_{target}_streaming.joblib')
+joblib.dump(model_columns, 'models/model_columns_streaming.joblib')
+
+print(f"✅ DONE! Trained on {all_stats['rows']} rows. "
+      "Models saved to models/model_max_streaming.joblib & models/model_min_streaming.joblib.")
@@ -0,0 +1,260 @@
+import os
+import io
+import json
+import hashlib
+import time
+import argparse
+import numpy as np
+import pandas as pd
+import joblib
+from joblib import Parallel, delayed
+from sklearn.ensemble import GradientBoostingRegressor, RandomForestRegressor
+from sklearn.metrics import mean_absolute_error
+
+# ---------------------------------------------------------
+# 0. SETTINGS
+# ---------------------------------------------------------
+parser = argparse.ArgumentParser(description="Hyperparameter search for the Max & Min models")
+parser.add_argument("--candidates", type=int, default=24, help="Random configs sampled per model family")
+parser.add_argument("--folds", type=int, default=4, help="Number of time-ordered CV folds")
+parser.add_argument("--eta", type=int, default=3, help="Successive halving: keep 1/eta of candidates per rung")
+parser.add_argument("--latency-weight", type=float, default=0.05, help="MAE penalty (°C) per ms of single-row predict latency")
+parser.add_argument("--jobs", type=int, default=-1, help="Parallel workers (-1 = all cores)")
+parser.add_argument("--seed", type=int, default=42)
+args = parser.parse_args()
+
+CACHE_DIR = "cache/tuning_folds"
+BEST_PARAMS_FILE = "models/best_params.json"
+LEADERBOARD_FILE = "models/tuning_leaderboard.csv"
+
+# Search spaces (sampled randomly, each key independently)
+search_spaces = {
+    'Gradient_Boosting': {
+        'n_estimators': [50, 100, 200, 300],
+        'learning_rate': [0.03, 0.05, 0.1, 0.2],
+        'max_depth': [2, 3, 4, 5],
+        'subsample': [0.7, 0.85, 1.0],
+        'min_samples_leaf': [1, 5, 20],
+    },
+    'Random_Forest': {
+        'n_estimators': [50, 100, 200],
+        'max_depth': [6, 10, 14, None],
+        'min_samples_leaf': [1, 5, 20],
+        'max_features': [0.5, 0.8, 1.0],
+    },
+}
+
+model_classes = {
+    'Gradient_Boosting': GradientBoostingRegressor,
+    'Random_Forest': RandomForestRegressor,
+}
+
+# ---------------------------------------------------------
+# 1. LOAD DATA (same preparation as train_gradientboost.py)
+# ---------------------------------------------------------
+print("⏳ Loading data...")
+try:
+    df = pd.read_csv("resource/vietnam_weather_full_filled.csv")
+except:
+    df = pd.read_csv("resource/vietnam_weather_final.csv")
+
+df['time'] = pd.to_datetime(df['time'], dayfirst=True)
+df['Month'] = df['time'].dt.month
+
+city_map = {
+    'Huế': 'Hue', 'Cà Mau': 'Ca Mau', 'Đà Nẵng': 'Da Nang',
+    'Đà Lạt': 'Da Lat', 'Hà Nội': 'Hanoi',
+    'TP. Hồ Chí Minh': 'Ho Chi Minh City', 'Hồ Chí Minh': 'Ho Chi Minh City'
+}
+df['city'] = df['city'].replace(city_map)
+
+for col in ['precipitation_sum', 'humidity_avg', 'pressure_avg']:
+    df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
+
+df['Target_NextDay_Max'] = df.groupby('city')['temperature_2m_max'].shift(-1)
+df['Target_NextDay_Min'] = df.groupby('city')['temperature_2m_min'].shift(-1)
+df = df.dropna(subset=['Target_NextDay_Max', 'Target_NextDay_Min'])
+
+features = [
+    'temperature_2m_max', 'temperature_2m_min',
+    'precipitation_sum', 'humidity_avg', 'pressure_avg', 'Month'
+]
+X = pd.get_dummies(df[features + ['city']], columns=['city'], drop_first=True).astype(float)
+targets = {'max': df['Target_NextDay_Max'], 'min': df['Target_NextDay_Min']}
+
+# ---------------------------------------------------------
+# 2. TIME-ORDERED FOLDS (expanding window, cached on disk)
+# ---------------------------------------------------------
+# Fold k trains on every day before its validation block, so the
+# model never sees the "future" it is scored on.
+print(f"📅 Building {args.folds} time-ordered folds...")
+os.makedirs(CACHE_DIR, exist_ok=True)
+
+# Cache key: hash of the feature matrix, its columns and the targets, so a
+# changed CSV, feature list or fallback file never reuses stale folds
+data_hash = hashlib.sha256(b"fold-format-2")
+data_hash.update(json.dumps(list(X.columns)).encode())
+data_hash.update(pd.util.hash_pandas_object(X, index=False).values.tobytes())
+for t, y in targets.items():
+    data_hash.update(pd.util.hash_pandas_object(y, index=False).values.tobytes())
+data_hash = data_hash.hexdigest()[:12]
+
+dates = np.sort(df['time'].unique())
+blocks = np.array_split(dates, args.folds + 1)
+
+fold_files = []
+for k in range(args.folds):
+    val_dates = blocks[k + 1]
+    train_mask = (df['time'] < val_dates[0]).values
+    val_mask = df['time'].isin(val_dates).values
+
+    path = os.path.join(CACHE_DIR, f"fold_{k}_of_{args.folds}_{data_hash}.joblib")
+    if not os.path.exists(path):
+        joblib.dump({
+            'X_train': X.values[train_mask],
+            'X_val': X.values[val_mask],
+            'y_train': {t: y.values[train_mask] for t, y in targets.items()},
+            'y_val': {t: y.values[val_mask] for t, y in targets.items()},
+            'columns': list(X.columns),
+        }, path)
+    fold_files.append(path)
+    print(f"   -> Fold {k}: train < {pd.Timestamp(val_dates[0]).date()}, "
+          f"validate {pd.Timestamp(val_dates[0]).date()} .. {pd.Timestamp(val_dates[-1]).date()}")
+
+# One-row DataFrame, exactly what app.py feeds the model on every forecast step
+latency_row = X.iloc[[0]]
+
+# ---------------------------------------------------------
+# 3. TRIAL EVALUATION
+# ---------------------------------------------------------
+# Runs in the parallel workers. Everything it needs comes from its small
+# arguments and the cached fold file (no module globals, so joblib does not
+# ship the feature matrix with every job).
+def evaluate(family, params, target, fold_path, seed):
+    # mmap_mode lets every worker share the cached arrays instead of copying them
+    fold = joblib.load(fold_path, mmap_mode='r')
+    model = model_classes[family](random_state=seed, **params)
+    # Fit on a DataFrame like train_gradientboost.py, so predict() pays the
+    # same feature-name check as in the app
+    model.fit(pd.DataFrame(fold['X_train'], columns=fold['columns']), fold['y_train'][target])
+    mae = mean_absolute_error(fold['y_val'][target],
+                              model.predict(pd.DataFrame(fold['X_val'], columns=fold['columns'])))
+
+    buffer = io.BytesIO()
+    joblib.dump(model, buffer)
+    size_kb = buffer.tell() / 1024
+    return mae, size_kb, model
+
+
+# Runs in the parent after the parallel fits, one model at a time, so the
+# number does not depend on how busy the other workers are.
+def measure_latency(model, runs=5, calls=10):
+    # Inference cost: 1 row at a time, as in calculate_forecast()
+    model.predict(latency_row)
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        for _ in range(calls):
+            model.predict(latency_row)
+        timings.append((time.perf_counter() - start) / calls * 1000)
+    return float(np.median(timings))
+
+
+def sample_candidates(rng):
+    candidates = []
+    for family, space in search_spaces.items():
+        seen = set()
+        for _ in range(args.candidates * 5):
+            if len(seen) >= args.candidates:
+                break
+            params = {key: values[rng.integers(len(values))] for key, values in space.items()}
+            params = {k: (v.item() if hasattr(v, 'item') else v) for k, v in params.items()}
+            key = json.dumps(params, sort_keys=True)
+            if key not in seen:
+                seen.add(key)
+                candidates.append({'family': family, 'params': params})
+    return candidates
+
+# ---------------------------------------------------------
+# 4. SUCCESSIVE HALVING SEARCH
+# ---------------------------------------------------------
+# Rung 0 scores every candidate on the most recent fold only. Each
+# following rung keeps the best 1/eta and adds older folds, until the
+# survivors have been scored on all folds.
+def search(target):
+    rng = np.random.default_rng(args.seed)
+    trials = sample_candidates(rng)
+    for trial in trials:
+        trial['scores'] = {}
+
+    n_rungs = max(1, int(np.ceil(np.log(args.folds) / np.log(args.eta))))
+    fold_order = list(reversed(range(args.folds)))
+    alive = trials
+
+    for rung in range(n_rungs + 1):
+        n_folds = max(1, int(np.ceil(args.folds * args.eta ** (rung - n_rungs))))
+        folds = fold_order[:n_folds]
+
+        jobs = [(trial, k) for trial in alive for k in folds if k not in trial['scores']]
+        print(f"   -> Rung {rung}: {len(alive)} candidates x {n_folds} fold(s) ({len(jobs)} fits)")
+        results = Parallel(n_jobs=args.jobs)(
+            delayed(evaluate)(trial['family'], trial['params'], target, fold_files[k], args.seed)
+            for trial, k in jobs
+        )
+        for (trial, k), (mae, size_kb, model) in zip(jobs, results):
+            trial['scores'][k] = (mae, measure_latency(model), size_kb)
+
+        for trial in alive:
+            scored = [trial['scores'][k] for k in folds]
+            trial['mae'] = float(np.mean([s[0] for s in scored]))
+            trial['latency_ms'] = float(np.mean([s[1] for s in scored]))
+            trial['size_kb'] = float(np.mean([s[2] for s in scored]))
+            trial['folds'] = n_folds
+            trial['score'] = trial['mae'] + args.latency_weight * trial['latency_ms']
+
+        if rung == n_rungs:
+            break
+        alive = sorted(alive, key=lambda t: t['score'])[:max(1, len(alive) // args.eta)]
+
+    # Fully evaluated candidates rank above pruned ones
+    return sorted(trials, key=lambda t: (-t['folds'], t['score']))
+
+# ---------------------------------------------------------
+# 5. RUN & SAVE
+# ---------------------------------------------------------
+print("🔍 Searching hyperparameters...")
+best_params = {}
+leaderboard = []
+
+for target in ['max', 'min']:
+    print(f"\n🎯 Target: Next Day {target.upper()}")
+    ranked = search(target)
+    best = ranked[0]
+    best_params[target] = {
+        'model': best['family'],
+        'params': best['params'],
+        'mae': round(best['mae'], 4),
+        'latency_ms': round(best['latency_ms'], 4),
+        'size_kb': round(best['size_kb'], 1),
+    }
+    for rank, trial in enumerate(ranked, start=1):
+        leaderboard.append({
+            'target': target,
+            'rank': rank,
+            'model': trial['family'],
+            'params': json.dumps(trial['params'], sort_keys=True),
+            'folds': trial['folds'],
+            'mae': round(trial['mae'], 4),
+            'latency_ms': round(trial['latency_ms'], 4),
+            'size_kb': round(trial['size_kb'], 1),
+            'score': round(trial['score'], 4),
+        })
+    print(f"   ✅ Best: {best['family']} {best['params']}")
+    print(f"      MAE {best['mae']:.4f}°C | {best['latency_ms']:.3f} ms/predict | {best['size_kb']:.0f} KB")
+
+with open(BEST_PARAMS_FILE, 'w') as f:
+    json.dump(best_params, f, indent=2)
+pd.DataFrame(leaderboard).to_csv(LEADERBOARD_FILE, index=False)
+
+print(f"\n✅ DONE! Best config saved to {BEST_PARAMS_FILE}, leaderboard to {LEADERBOARD_FILE}.")
+print("   Run train_gradientboost.py to retrain the app models with it.")